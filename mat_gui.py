@@ -18,50 +18,81 @@ from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 import numpy as np
+import hashlib
 import re
-
-import pdb
+from collections import OrderedDict
 
 from mat_widgets import *
 from mat_operation import *
 
+# Precompiled pattern used to recover the operation counter from previously
+# saved output when a file is loaded. Compiling once at import time keeps the
+# load path free of any pattern compilation or cache lookups.
+_OP_COUNTER_RE = re.compile(r'Operation (\d+)')
+
+# Precompiled patterns used to validate the size and range entry fields. A
+# regex match is a cheap DFA-style scan, where the old float()/int() round
+# trips built a ValueError and traceback on every typo. The float pattern
+# accepts plain decimal notation, matching what the range validators let the
+# user type.
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?(?:\d+\.?\d*|\.\d+)$')
+
+# Shared bold font used for the matrix table headers. It is created lazily by
+# _boldHeaderFont since fonts can't be constructed until the QApplication
+# exists, and then the one instance is reused by every header.
+_BOLD_HEADER_FONT = None
+
+def _boldHeaderFont():
+    """Return the shared bold font used for the matrix table headers."""
+
+    global _BOLD_HEADER_FONT
+    if _BOLD_HEADER_FONT is None:
+        _BOLD_HEADER_FONT = QFont()
+        _BOLD_HEADER_FONT.setWeight(QFont.Bold)
+    return _BOLD_HEADER_FONT
+
 class MatOpGUI(QMainWindow):
 
     #===========================================================================
     # Define class constants
     #===========================================================================
 
-    # Define the list of mathematical operations the user can perform on the
-    # two operations.
-    OPERATIONS = ['Multiply',
-                  'Sum of Column of Product',
-                  'Product of Column of Product',
-                  'Cumulative Sum Along Column of Product',
-                  'Cumulative Product Along Column of Product',
-                  'Sum of Row of Product',
-                  'Product of Row of Product',
-                  'Cumulative Sum Along Row of Product',
-                  'Cumulative Product Along Row of Product',
-                  'Min of Product',
-                  'Max of Product',
-                  'Mean of Product',
-                  'Median of Product',
-                  'Total Sum of Product',
-                  'Total Product of Product']
-
-    # Define the operations that, when selected, will cause the operations
-    # selection row/column entry field to appear to the user.
-    OPS_TO_MAKE_ENTRY_VISIBLE = ['Sum of Column of Product',
-                                 'Product of Column of Product',
-                                 'Sum of Row of Product',
-                                 'Product of Row of Product']
-
-    # Define the operations that will act on a row of the resultant matrix.
-    # This will be used to determine the placeholder text of a line edit field
-    # for entering a row/column, to help the user.
-    OPS_ON_ROW = ['Sum of Row of Product',
-                  'Product of Row of Product']
+    # Define the table of mathematical operations the user can perform on the
+    # two matrices. Each entry is a row of
+    #
+    #     (name, needsEntry, rowOrCol, callable)
+    #
+    # where name is the text shown in the dropdown, needsEntry says whether
+    # the row/column entry field must be visible for the operation, rowOrCol
+    # ('row', 'col', or None) says which axis that entry indexes, and the
+    # callable takes the MatrixOperation object plus the one-based row/column
+    # entered by the user (None for the operations that don't need it). The
+    # table is indexed by the dropdown's row, so selecting an operation is a
+    # single integer lookup rather than string comparisons against several
+    # parallel collections.
+    OPS = [
+        ('Multiply',                                   False, None,  lambda matop, index: matop.product),
+        ('Sum of Column of Product',                   True,  'col', lambda matop, index: matop.getProductColSum(index - 1)),
+        ('Product of Column of Product',               True,  'col', lambda matop, index: matop.getProductColProd(index - 1)),
+        ('Cumulative Sum Along Column of Product',     False, None,  lambda matop, index: matop.getProductColCumSum()),
+        ('Cumulative Product Along Column of Product', False, None,  lambda matop, index: matop.getProductColCumProd()),
+        ('Sum of Row of Product',                      True,  'row', lambda matop, index: matop.getProductRowSum(index - 1)),
+        ('Product of Row of Product',                  True,  'row', lambda matop, index: matop.getProductRowProd(index - 1)),
+        ('Cumulative Sum Along Row of Product',        False, None,  lambda matop, index: matop.getProductRowCumSum()),
+        ('Cumulative Product Along Row of Product',    False, None,  lambda matop, index: matop.getProductRowCumProd()),
+        ('Min of Product',                             False, None,  lambda matop, index: matop.getProductTotalMin()),
+        ('Max of Product',                             False, None,  lambda matop, index: matop.getProductTotalMax()),
+        ('Mean of Product',                            False, None,  lambda matop, index: matop.getProductTotalMean()),
+        ('Median of Product',                          False, None,  lambda matop, index: matop.getProductTotalMedian()),
+        ('Total Sum of Product',                       False, None,  lambda matop, index: matop.getProductTotalSum()),
+        ('Total Product of Product',                   False, None,  lambda matop, index: matop.getProductTotalProd()),
+    ]
     
+    # Define the maximum number of MatrixOperation objects kept in the
+    # operation cache before the oldest entry is evicted.
+    MATOP_CACHE_SIZE = 8
+
     #===========================================================================
     # Initialization function
     #===========================================================================
@@ -84,9 +115,47 @@ class MatOpGUI(QMainWindow):
         self.__fontColor  = QColor(250,250,250)
         self.__guiColor   = QColor(162, 62, 72) # Official GUI color
 
+        # Define the cache of configured background palettes used by the frame
+        # wrapper, keyed by color. Every frame sharing a background color then
+        # reuses a single QPalette instead of copying and detaching its own.
+        self.__paletteCache = {}
+
         # Define counter for the number of operations performed
         self.__opCounter = 0
 
+        # Define the buffer of output text waiting to be written to the output
+        # text box, along with the single-shot timer that flushes it. Appends
+        # are debounced through the timer so a rapid burst of operations
+        # coalesces into one QTextEdit relayout instead of one per append.
+        self.__pendingOutput = []
+        self.__flushTimer = QTimer(self, singleShot = True, interval = 50)
+        self.__flushTimer.timeout.connect(self.__flushOutput)
+
+        # Define the per-matrix widget records. Each of 'A' and 'B' maps to a
+        # dict that the shared matrix frame creators fill in with the input
+        # table, size entries, and random generation widgets for that matrix.
+        self.__mat = {'A': {}, 'B': {}}
+
+        # Define the cache of previously constructed MatrixOperation objects,
+        # keyed by the matrix shapes plus a digest of the matrix contents and
+        # run name. When the user cycles through different operations on the
+        # same inputs, each hit skips re-running the matrix multiply. The
+        # OrderedDict doubles as the eviction queue: the oldest entry is
+        # dropped once MATOP_CACHE_SIZE is reached.
+        self.__matopCache = OrderedDict()
+
+        # Define the prototype item cloned into any table cell that needs a
+        # fresh (empty) item. clone() copies the prototype's plain data in C++,
+        # which is cheaper than running the full QTableWidgetItem constructor
+        # from Python for every new cell.
+        self.__emptyItem = QTableWidgetItem('')
+
+        # Define the random generator used for randomly populating the matrices.
+        # Creating it once here avoids re-seeding a new generator on every
+        # Generate click, and the Generator API draws the whole matrix with a
+        # single vectorized call.
+        self.__rng = np.random.default_rng()
+
         # -- Set Window Properties ---------------------------------------------
 
         self.setAcceptDrops(True)
@@ -100,6 +169,11 @@ class MatOpGUI(QMainWindow):
         self.__createGUI()
         self.show()
 
+        # Let Qt work through the queued layout and polish events now, while
+        # the window is coming up, rather than folding that work into the
+        # first user interaction.
+        QApplication.processEvents()
+
     def frame(func):
         """
         Wrapper function for creating frames in a widget. This allows a function
@@ -111,30 +185,43 @@ class MatOpGUI(QMainWindow):
                     bgcolor = QColor(255,255,255,255), frameShape = None,
                     frameShadow = None, lineWidth = 0, **kwargs):
 
-            # Create the QFrame and QGridLayout
-            kwargs['frame'] = QFrame(frameShape = frameShape, frameShadow = frameShadow, lineWidth = lineWidth)
-            kwargs['grid'] = QGridLayout(margin = gridMargin, spacing = gridSpacing)
+            # Create the QFrame and QGridLayout as plain locals. They're passed
+            # to the wrapped function as explicit keyword arguments so neither
+            # the wrapper nor the wrapped function pays a dict lookup every
+            # time they're touched.
+            newFrame = QFrame(frameShape = frameShape, frameShadow = frameShadow, lineWidth = lineWidth)
+            newGrid = QGridLayout(margin = gridMargin, spacing = gridSpacing)
 
             # Call the wrapped function
-            func(self, *args, **kwargs)
-            
-            # Set the background color of the frame
-            kwargs['frame'].setAutoFillBackground(True)
-            p = kwargs['frame'].palette()
-            p.setColor(kwargs['frame'].backgroundRole(), bgcolor)
-            kwargs['frame'].setPalette(p)
+            func(self, *args, frame = newFrame, grid = newGrid, **kwargs)
+
+            # Set the background color of the frame, pulling the configured
+            # palette from the per-color cache (and populating the cache on
+            # the first sighting of a color). A shared palette is deliberately
+            # used instead of a background-color style sheet: style sheets
+            # cascade into child widgets and switch QFrame over to style-sheet
+            # box rendering, which would change how the styled/sunken frames
+            # draw.
+            newFrame.setAutoFillBackground(True)
+            key = bgcolor.rgba()
+            pal = self.__paletteCache.get(key)
+            if pal is None:
+                pal = QPalette()
+                pal.setColor(QPalette.Window, bgcolor)
+                self.__paletteCache[key] = pal
+            newFrame.setPalette(pal)
 
             # Set the grid created in this function as the frame's layout and
             # add the frame to the parent's grid at the position provided
-            kwargs['frame'].setLayout(kwargs['grid'])
+            newFrame.setLayout(newGrid)
             if grid is not None:
-                grid.addWidget(kwargs['frame'], *pos)
+                grid.addWidget(newFrame, *pos)
             else:
-                self.grid.addWidget(kwargs['frame'], *pos)
+                self.grid.addWidget(newFrame, *pos)
 
             # Return the frame
-            return kwargs['frame']
-        
+            return newFrame
+
         return wrapper
 
     #===========================================================================
@@ -219,7 +306,7 @@ class MatOpGUI(QMainWindow):
     #===========================================================================
 
     @frame
-    def __createHeaderBar(self, *args, **kwargs):
+    def __createHeaderBar(self, *args, frame = None, grid = None, **kwargs):
         """
         Create the large header bar at the top of the GUI. This just adds a nice,
         convenient banner at the top for branding.
@@ -229,10 +316,10 @@ class MatOpGUI(QMainWindow):
         matOpLabel = QLabel('Matrix Operations')
         configureQLabel(matOpLabel, font = self.__fontFamily, font_size = 20,
                         font_color = self.__fontColor, alignment = Qt.AlignCenter)
-        kwargs['grid'].addWidget(matOpLabel, 0, 1)
+        grid.addWidget(matOpLabel, 0, 1)
 
     @frame
-    def __createContentFrame(self, *args, **kwargs):
+    def __createContentFrame(self, *args, frame = None, grid = None, **kwargs):
         """
         Create the main content of the GUI. This is a second frame below the header.
         This calls several sub-functions that create specific elements of the main
@@ -241,7 +328,7 @@ class MatOpGUI(QMainWindow):
 
         # Create the frame at the top for entering the name of the run
         runNameFrame = self.__createRunNameFrame(
-            (0,0,1,2), grid = kwargs['grid'], gridmargin = 5, gridSpacing = 5,
+            (0,0,1,2), grid = grid, gridmargin = 5, gridSpacing = 5,
         )
 
         # Set the tool tip for this frame to help the user out
@@ -249,32 +336,26 @@ class MatOpGUI(QMainWindow):
 
         # -- Create Matrix Input Frames ----------------------------------------
 
-        # Create the two frames which allows the user to input the two matrices
-        self.__matrixAFrame = self.__createMatrixAInputFrame(
-            (1,0), grid = kwargs['grid'], gridMargin = 5, gridSpacing = 5,
-            frameShape = QFrame.StyledPanel, frameShadow = QFrame.Sunken, lineWidth = 0,
-        )
-        self.__matrixBFrame = self.__createMatrixBInputFrame(
-            (1,1), grid = kwargs['grid'], gridMargin = 5, gridSpacing = 5,
-            frameShape = QFrame.StyledPanel, frameShadow = QFrame.Sunken, lineWidth = 0,
-        )
-
-        # Set the tool tips for this frame to help the user out.
-        self.__matrixAFrame.setToolTip((
-            'Enter values for Matrix A here. You can change the matrix size to\n'
-            'a max of 10x10 and also randomly generate values for the matrix.'
-        ))
-        self.__matrixBFrame.setToolTip((
-            'Enter values for Matrix B here. You can change the matrix size to\n'
-            'a max of 10x10 and also randomly generate values for the matrix.'
-        ))
+        # Create the two frames which allows the user to input the two matrices.
+        # The frames are identical apart from which matrix they act on, so one
+        # data-driven loop builds both, with the tool tips set to help the
+        # user out.
+        for column, which in enumerate(('A', 'B')):
+            matrixFrame = self.__createMatrixInputFrame(
+                (1,column), which, grid = grid, gridMargin = 5, gridSpacing = 5,
+                frameShape = QFrame.StyledPanel, frameShadow = QFrame.Sunken, lineWidth = 0,
+            )
+            matrixFrame.setToolTip((
+                f'Enter values for Matrix {which} here. You can change the matrix size to\n'
+                'a max of 10x10 and also randomly generate values for the matrix.'
+            ))
 
         # -- Create Operation Selection Frame ----------------------------------
 
         # Create the frame below the two matrices for selecting the matrix
         # operation to perform
         opSelectFrame = self.__createOperationSelectionFrame(
-            (2,0,1,2), grid = kwargs['grid'], gridMargin = 0, gridSpacing = 5
+            (2,0,1,2), grid = grid, gridMargin = 0, gridSpacing = 5
         )
 
         # Set the tool tip for this frame to help the user out
@@ -286,153 +367,100 @@ class MatOpGUI(QMainWindow):
 
         # -- Create Output Text Box --------------------------------------------
 
-        # Create the output text box.
-        self.__outputTextBox = QTextEdit()
-
-        # Make it so user's can't modify the text
-        self.__outputTextBox.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        
-        # Do not allow text wrapping (to prevent the output from becoming too
-        # confusing).
-        self.__outputTextBox.setLineWrapMode(QTextEdit.NoWrap)
-
-        # Update the font to a monospaced font.
-        font = self.__outputTextBox.currentFont()
-        font.setPointSize(8)
-        font.setFamily('courier')
-        self.__outputTextBox.setFont(font)
-
-        # Make it a least 400 pixels tall
-        self.__outputTextBox.setMinimumHeight(400)
-
-        # Make the text box initially invisible until data needs to be displayed
-        # so as not to confuse the user.
-        self.__outputTextBox.setVisible(False)
-
-        # Add to the grid
-        kwargs['grid'].addWidget(self.__outputTextBox, 3, 0, 1, 2)
+        # The output text box is not created here; constructing a QTextEdit
+        # allocates a full text document and layout engine, which is wasted
+        # startup work for a widget that stays hidden until the first result.
+        # __ensureOutputTextBox builds it on first use instead, so just record
+        # the grid it will need to be added to.
+        self.__outputTextBox = None
+        self.__contentGrid = grid
 
         # -- Set Grid Properties -----------------------------------------------
 
-        kwargs['grid'].setRowStretch(1, 1)
-        kwargs['grid'].setColumnStretch(0, 1)
-        kwargs['grid'].setColumnStretch(1, 1)
+        grid.setRowStretch(1, 1)
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 1)
 
     #===========================================================================
     # Level 2: Name, Matrix, Options, and Output Frames
     #===========================================================================
 
     @frame
-    def __createRunNameFrame(self, *args, **kwargs):
+    def __createRunNameFrame(self, *args, frame = None, grid = None, **kwargs):
         """
         Create the frame which allows users to enter the name of the run
         """
 
         # Create the QLabel giving direction to the user
-        kwargs['grid'].addWidget(QLabel('Name Your Run'), 0, 0)
+        grid.addWidget(QLabel('Name Your Run'), 0, 0)
 
         # Create the line edit for the user to enter the name
         self.__nameLineEdit = QLineEdit()
         self.__nameLineEdit.setPlaceholderText('Enter run name...')
-        kwargs['grid'].addWidget(self.__nameLineEdit, 0, 1)
+        grid.addWidget(self.__nameLineEdit, 0, 1)
 
         # Set grid properties
-        kwargs['grid'].setColumnStretch(1, 1)
+        grid.setColumnStretch(1, 1)
 
     @frame
-    def __createMatrixAInputFrame(self, *args, **kwargs):
-        """
-        Create the input frame for defining Matrix A. This has a label at the
-        top demarking this as Matrix A. It has a sub-frame for changing the size
-        of the frame, a table for defining the matrix, and a sub-frame for choosing
-        to randomly generate the matrix.
+    def __createMatrixInputFrame(self, which, *args, frame = None, grid = None, **kwargs):
         """
+        Create the input frame for defining one of the two matrices. This has a
+        label at the top demarking which matrix this is. It has a sub-frame for
+        changing the size of the frame, a table for defining the matrix, and a
+        sub-frame for choosing to randomly generate the matrix.
 
-        # Create the label at the top of this frame, labeling this as Matrix A
-        sectionLabel = QLabel('Matrix A')
-        configureQLabel(sectionLabel, font = self.__fontFamily, font_size = 16,
-                        alignment = Qt.AlignCenter)
-        kwargs['grid'].addWidget(sectionLabel, 0, 0)
-
-        # Create section for specifying the matrix size
-        self.__createMatrixASizeFrame(
-            (1,0), grid = kwargs['grid'], gridMargin = 0, gridSpacing = 0
-        )
-
-        # Create section for inputing the matrix. Default to a 3x3 matrix.
-        self.__matrixAInputTable = QTableWidget(3, 3)
-        font = self.__matrixAInputTable.horizontalHeader().font()
-        font.setWeight(QFont.Bold)
-        self.__matrixAInputTable.setAlternatingRowColors(True)
-        self.__matrixAInputTable.horizontalHeader().setFont(font)
-        self.__matrixAInputTable.verticalHeader().setFont(font)
-        for row in range(3):
-            for col in range(3):
-                self.__matrixAInputTable.setItem(row, col, QTableWidgetItem(''))
-        kwargs['grid'].addWidget(self.__matrixAInputTable, 2, 0)
-
-        # Create section for random matrix generation
-        self.__createMatrixARandFrame(
-            (3,0), grid = kwargs['grid'], gridMargin = 0, gridSpacing = 0
-        )
-
-        # Set the grid properties|
-        kwargs['grid'].setRowStretch(2,1)
-        
-    @frame
-    def __createMatrixBInputFrame(self, *args, **kwargs):
-        """
-        Create the input frame for defining Matrix B. This has a label at the
-        top demarking this as Matrix B. It has a sub-frame for changing the size
-        of the frame, a table for defining the matrix, and a sub-frame for choosing
-        to randomly generate the matrix.
+        Input:
+            which: A string, either 'A' or 'B', naming the matrix this frame
+                acts on. The widgets created here are recorded under this key
+                in the per-matrix widget records.
         """
 
-        # Create the label at the top of this frame, labeling this as Matrix B
-        sectionLabel = QLabel('Matrix B')
+        # Create the label at the top of this frame, labeling which matrix it is
+        sectionLabel = QLabel(f'Matrix {which}')
         configureQLabel(sectionLabel, font = self.__fontFamily, font_size = 16,
                         alignment = Qt.AlignCenter)
-        kwargs['grid'].addWidget(sectionLabel, 0, 0)
+        grid.addWidget(sectionLabel, 0, 0)
 
         # Create section for specifying the matrix size
-        self.__createMatrixBSizeFrame(
-            (1,0), grid = kwargs['grid'], gridMargin = 0, gridSpacing = 0
+        self.__createMatrixSizeFrame(
+            (1,0), which, grid = grid, gridMargin = 0, gridSpacing = 0
         )
 
-        # Create section for inputing the matrix
-        self.__matrixBInputTable = QTableWidget(3, 3)
-        font = self.__matrixBInputTable.horizontalHeader().font()
-        font.setWeight(QFont.Bold)
-        self.__matrixBInputTable.setAlternatingRowColors(True)
-        self.__matrixBInputTable.horizontalHeader().setFont(font)
-        self.__matrixBInputTable.verticalHeader().setFont(font)
+        # Create section for inputing the matrix. Default to a 3x3 matrix.
+        inputTable = QTableWidget(3, 3)
+        font = _boldHeaderFont()
+        inputTable.setAlternatingRowColors(True)
+        inputTable.horizontalHeader().setFont(font)
+        inputTable.verticalHeader().setFont(font)
         for row in range(3):
             for col in range(3):
-                self.__matrixBInputTable.setItem(row, col, QTableWidgetItem(''))
-        kwargs['grid'].addWidget(self.__matrixBInputTable, 2, 0)
+                inputTable.setItem(row, col, self.__emptyItem.clone())
+        grid.addWidget(inputTable, 2, 0)
+        self.__mat[which]['inputTable'] = inputTable
 
         # Create section for random matrix generation
-        self.__createMatrixBRandFrame(
-            (3,0), grid = kwargs['grid'], gridMargin = 0, gridSpacing = 0
+        self.__createMatrixRandFrame(
+            (3,0), which, grid = grid, gridMargin = 0, gridSpacing = 0
         )
 
         # Set the grid properties|
-        kwargs['grid'].setRowStretch(2,1)
+        grid.setRowStretch(2,1)
 
     @frame
-    def __createOperationSelectionFrame(self, *args, **kwargs):
+    def __createOperationSelectionFrame(self, *args, frame = None, grid = None, **kwargs):
         """
         Create the frame which allows the user select the math operation to
         perform.
         """
         
-        kwargs['grid'].addWidget(QLabel('Select the Operation:'), 2, 0)
+        grid.addWidget(QLabel('Select the Operation:'), 2, 0)
 
         # Create the dropdown list of operations
         self.__opSelectComboBox = QComboBox()
-        self.__opSelectComboBox.addItems(MatOpGUI.OPERATIONS)
+        self.__opSelectComboBox.addItems([op[0] for op in MatOpGUI.OPS])
         self.__opSelectComboBox.currentIndexChanged.connect(self.__opSelectChanged)
-        kwargs['grid'].addWidget(self.__opSelectComboBox, 2, 1)
+        grid.addWidget(self.__opSelectComboBox, 2, 1)
 
         # Create the row/column entry field, for operations which return a
         # result from just a single column/row. This will be where the user
@@ -442,218 +470,157 @@ class MatOpGUI(QMainWindow):
         # is selected that will require this widget, it will be shown to the user.
         self.__opEntryField = QLineEdit()
         self.__opEntryField.setVisible(False)
-        kwargs['grid'].addWidget(self.__opEntryField, 2, 2)
+        grid.addWidget(self.__opEntryField, 2, 2)
 
         # Create the Go! button
         self.__goButton = QPushButton('Go!')
         self.__goButton.clicked.connect(self.__goButtonClicked)
-        kwargs['grid'].addWidget(self.__goButton, 2, 3)
+        grid.addWidget(self.__goButton, 2, 3)
+
+        # Run the selection-changed callback once by hand for the initial
+        # selection, since programmatically adding the items does not emit the
+        # signal. This pre-binds the selected operation for the Go! handler.
+        self.__opSelectChanged(self.__opSelectComboBox.currentIndex())
 
         # Set the grid properties
-        kwargs['grid'].setColumnStretch(1,1)
+        grid.setColumnStretch(1,1)
 
     #===========================================================================
     # Level 3: Matrix Size and Random Generation Collapsable Frames
     #===========================================================================
 
-    # == Matrix A ==============================================================
-
     @frame
-    def __createMatrixASizeFrame(self, *args, **kwargs):
+    def __createMatrixSizeFrame(self, which, *args, frame = None, grid = None, **kwargs):
         """
         Create a frame with a collapsable section for allowing the user to change
         the size of the matrix. This is just a text box for entering both the row
         and column and a button to change the size.
-        """
-
-        # Create a collapsable section to add the various widgets to. This will
-        # make the GUI output a bit cleaner and only show this to the user if
-        # they need to see it.
-        self.__matrixASizeCollapsable = CollapsableSection('Matrix Size', True)
-
-        # Create the row size entry
-        self.__matrixARowSize = QLineEdit('3')
-        self.__matrixARowSize.setMaximumWidth(30)
-        self.__matrixARowSize.setPlaceholderText('Row')
-        self.__matrixASizeCollapsable.addWidget(self.__matrixARowSize, 0, 0)
-
-        # Create the 'X' label
-        self.__matrixASizeCollapsable.addWidget(QLabel('X'), 0, 1)
-
-        # Create the col size entry
-        self.__matrixAColSize = QLineEdit('3')
-        self.__matrixAColSize.setMaximumWidth(30)
-        self.__matrixAColSize.setPlaceholderText('Col')
-        self.__matrixASizeCollapsable.addWidget(self.__matrixAColSize, 0, 2)
-
-        # Create the Set Size button
-        self.__matrixASizeButton = QPushButton('Set Size')
-        self.__matrixASizeButton.clicked.connect(self.__matrixASetSizeClicked)
-        self.__matrixASizeCollapsable.addWidget(self.__matrixASizeButton, 0, 3)
-
-        # Set the grid properties
-        self.__matrixASizeCollapsable.setColumnStretch(4,1)
-        kwargs['grid'].addWidget(self.__matrixASizeCollapsable, 1, 0)
-
-    @frame
-    def __createMatrixARandFrame(self, *args, **kwargs):
-        """
-        Create a frame with a collapsable section for allowing the user to randomly
-        populate the matrix. The collapsable section has a section for defining
-        the range to use and for selecting to generate either decimals or integers.
-        Finally there's a button to actually generate the matrix content.
-        """
-
-        # Create a collapsable section to add the various widgets to. This will
-        # make the GUI output a bit cleaner and only show this to the user if
-        # they need to see it.
-        self.__matrixARandCollapsable = CollapsableSection('Random Generation', True)
-
-        # -- Create range section ----------------------------------------------
-
-        self.__matrixARandCollapsable.addWidget(QLabel('Range:'), 0, 0)
-
-        # Create the minimum line edit
-        self.__matrixAMinRandRange = QLineEdit('0.0')
-        self.__matrixAMinRandRange.setMaximumWidth(50)
-        self.__matrixAMinRandRange.setPlaceholderText('min')
-        self.__matrixARandCollapsable.addWidget(self.__matrixAMinRandRange, 0, 1)
-
-        # Create the '-' label
-        self.__matrixARandCollapsable.addWidget(QLabel('-', alignment = Qt.AlignCenter), 0, 2)
-
-        # Create the maximum line edit
-        self.__matrixAMaxRandRange = QLineEdit('1.0')
-        self.__matrixAMaxRandRange.setMaximumWidth(50)
-        self.__matrixAMaxRandRange.setPlaceholderText('max')
-        self.__matrixARandCollapsable.addWidget(self.__matrixAMaxRandRange, 0, 3, 1, 2)
-
-        # -- Create number type section ----------------------------------------
-
-        self.__matrixARandCollapsable.addWidget(QLabel('Type:'), 1, 0)
-
-        # Create the button group for the number type radio buttons
-        self.__matrixARandButtonGroup = QButtonGroup()
-
-        # Create the 'decimal' radio button
-        decimalButton = QRadioButton('Decimal')
-        decimalButton.setChecked(True)
-        self.__matrixARandButtonGroup.addButton(decimalButton, 0)
-        self.__matrixARandCollapsable.addWidget(decimalButton, 1, 1, 1, 3)
-
-        # Create the 'integer' radio button
-        integerButton = QRadioButton('Integer')
-        self.__matrixARandButtonGroup.addButton(integerButton, 1)
-        self.__matrixARandCollapsable.addWidget(integerButton, 1, 4, 1, 1)
 
-        # -- Create generation button ------------------------------------------
-
-        self.__matrixARandGenButton = QPushButton('Generate')
-        self.__matrixARandGenButton.clicked.connect(self.__matrixARandGenClicked)
-        self.__matrixARandCollapsable.addWidget(self.__matrixARandGenButton, 2, 0, 1, 5)
-
-        # Set the grid properties
-        self.__matrixARandCollapsable.setColumnStretch(5, 1)
-        kwargs['grid'].addWidget(self.__matrixARandCollapsable, 3, 0)
-
-    # == Matrix B ==============================================================
-
-    def __createMatrixBSizeFrame(self, *args, **kwargs):
-        """
-        Create a frame with a collapsable section for allowing the user to change
-        the size of the matrix. This is just a text box for entering both the row
-        and column and a button to change the size.
+        Input:
+            which: A string, either 'A' or 'B', naming the matrix this frame
+                acts on.
         """
 
         # Create a collapsable section to add the various widgets to. This will
         # make the GUI output a bit cleaner and only show this to the user if
         # they need to see it.
-        self.__matrixBSizeCollapsable = CollapsableSection('Matrix Size', True)
+        sizeCollapsable = CollapsableSection('Matrix Size', True)
 
-        # Create the row size entry
-        self.__matrixBRowSize = QLineEdit('3')
-        self.__matrixBRowSize.setMaximumWidth(30)
-        self.__matrixBRowSize.setPlaceholderText('Row')
-        self.__matrixBSizeCollapsable.addWidget(self.__matrixBRowSize, 0, 0)
+        # Create the row size entry. The validator stops anything but an
+        # in-range integer from being typed, so the Set Size callback can
+        # parse the text without defensive conversions.
+        rowSize = QLineEdit('3')
+        rowSize.setMaximumWidth(30)
+        rowSize.setPlaceholderText('Row')
+        rowSize.setValidator(QIntValidator(1, 10, self))
+        sizeCollapsable.addWidget(rowSize, 0, 0)
 
         # Create the 'X' label
-        self.__matrixBSizeCollapsable.addWidget(QLabel('X'), 0, 1)
+        sizeCollapsable.addWidget(QLabel('X'), 0, 1)
 
         # Create the col size entry
-        self.__matrixBColSize = QLineEdit('3')
-        self.__matrixBColSize.setMaximumWidth(30)
-        self.__matrixBColSize.setPlaceholderText('Col')
-        self.__matrixBSizeCollapsable.addWidget(self.__matrixBColSize, 0, 2)
+        colSize = QLineEdit('3')
+        colSize.setMaximumWidth(30)
+        colSize.setPlaceholderText('Col')
+        colSize.setValidator(QIntValidator(1, 10, self))
+        sizeCollapsable.addWidget(colSize, 0, 2)
+
+        # Create the Set Size button. The one parameterized callback serves
+        # both matrices, so bind which matrix this button acts on here.
+        sizeButton = QPushButton('Set Size')
+        sizeButton.clicked.connect(
+            lambda checked = False, which = which: self.__setSizeClicked(which)
+        )
+        sizeCollapsable.addWidget(sizeButton, 0, 3)
 
-        # Create the Set Size button
-        self.__matrixBSizeButton = QPushButton('Set Size')
-        self.__matrixBSizeButton.clicked.connect(self.__matrixBSetSizeClicked)
-        self.__matrixBSizeCollapsable.addWidget(self.__matrixBSizeButton, 0, 3)
+        # Record the widgets the callbacks will need for this matrix
+        self.__mat[which]['rowSize'] = rowSize
+        self.__mat[which]['colSize'] = colSize
 
         # Set the grid properties
-        self.__matrixBSizeCollapsable.setColumnStretch(4,1)
-        kwargs['grid'].addWidget(self.__matrixBSizeCollapsable, 1, 0)
+        sizeCollapsable.setColumnStretch(4,1)
+        grid.addWidget(sizeCollapsable, 1, 0)
 
     @frame
-    def __createMatrixBRandFrame(self, *args, **kwargs):
+    def __createMatrixRandFrame(self, which, *args, frame = None, grid = None, **kwargs):
         """
         Create a frame with a collapsable section for allowing the user to randomly
         populate the matrix. The collapsable section has a section for defining
         the range to use and for selecting to generate either decimals or integers.
         Finally there's a button to actually generate the matrix content.
+
+        Input:
+            which: A string, either 'A' or 'B', naming the matrix this frame
+                acts on.
         """
 
         # Create a collapsable section to add the various widgets to. This will
         # make the GUI output a bit cleaner and only show this to the user if
         # they need to see it.
-        self.__matrixBRandCollapsable = CollapsableSection('Random Generation', True)
+        randCollapsable = CollapsableSection('Random Generation', True)
 
         # -- Create range section ----------------------------------------------
 
-        self.__matrixBRandCollapsable.addWidget(QLabel('Range:'), 0, 0)
+        randCollapsable.addWidget(QLabel('Range:'), 0, 0)
+
+        # Create the validator shared by the min and max entries. This gates
+        # the input to plain decimal notation while the user types.
+        rangeValidator = QDoubleValidator(-1e12, 1e12, 6, self)
+        rangeValidator.setNotation(QDoubleValidator.StandardNotation)
 
         # Create the minimum line edit
-        self.__matrixBMinRandRange = QLineEdit('0.0')
-        self.__matrixBMinRandRange.setMaximumWidth(50)
-        self.__matrixBMinRandRange.setPlaceholderText('min')
-        self.__matrixBRandCollapsable.addWidget(self.__matrixBMinRandRange, 0, 1)
+        minRandRange = QLineEdit('0.0')
+        minRandRange.setMaximumWidth(50)
+        minRandRange.setPlaceholderText('min')
+        minRandRange.setValidator(rangeValidator)
+        randCollapsable.addWidget(minRandRange, 0, 1)
 
         # Create the '-' label
-        self.__matrixBRandCollapsable.addWidget(QLabel('-', alignment = Qt.AlignCenter), 0, 2)
+        randCollapsable.addWidget(QLabel('-', alignment = Qt.AlignCenter), 0, 2)
 
         # Create the maximum line edit
-        self.__matrixBMaxRandRange = QLineEdit('1.0')
-        self.__matrixBMaxRandRange.setMaximumWidth(50)
-        self.__matrixBMaxRandRange.setPlaceholderText('max')
-        self.__matrixBRandCollapsable.addWidget(self.__matrixBMaxRandRange, 0, 3, 1, 2)
+        maxRandRange = QLineEdit('1.0')
+        maxRandRange.setMaximumWidth(50)
+        maxRandRange.setPlaceholderText('max')
+        maxRandRange.setValidator(rangeValidator)
+        randCollapsable.addWidget(maxRandRange, 0, 3, 1, 2)
 
         # -- Create number type section ----------------------------------------
 
-        self.__matrixBRandCollapsable.addWidget(QLabel('Type:'), 1, 0)
+        randCollapsable.addWidget(QLabel('Type:'), 1, 0)
 
         # Create the button group for the number type radio buttons
-        self.__matrixBRandButtonGroup = QButtonGroup()
+        randButtonGroup = QButtonGroup()
 
         # Create the 'decimal' radio button
         decimalButton = QRadioButton('Decimal')
         decimalButton.setChecked(True)
-        self.__matrixBRandButtonGroup.addButton(decimalButton, 0)
-        self.__matrixBRandCollapsable.addWidget(decimalButton, 1, 1, 1, 3)
+        randButtonGroup.addButton(decimalButton, 0)
+        randCollapsable.addWidget(decimalButton, 1, 1, 1, 3)
 
         # Create the 'integer' radio button
         integerButton = QRadioButton('Integer')
-        self.__matrixBRandButtonGroup.addButton(integerButton, 1)
-        self.__matrixBRandCollapsable.addWidget(integerButton, 1, 4, 1, 1)
+        randButtonGroup.addButton(integerButton, 1)
+        randCollapsable.addWidget(integerButton, 1, 4, 1, 1)
 
         # -- Create generation button ------------------------------------------
 
-        self.__matrixBRandGenButton = QPushButton('Generate')
-        self.__matrixBRandGenButton.clicked.connect(self.__matrixBRandGenClicked)
-        self.__matrixBRandCollapsable.addWidget(self.__matrixBRandGenButton, 2, 0, 1, 5)
+        # The one parameterized callback serves both matrices, so bind which
+        # matrix this button acts on here.
+        randGenButton = QPushButton('Generate')
+        randGenButton.clicked.connect(
+            lambda checked = False, which = which: self.__randGenClicked(which)
+        )
+        randCollapsable.addWidget(randGenButton, 2, 0, 1, 5)
+
+        # Record the widgets the callbacks will need for this matrix
+        self.__mat[which]['minRandRange'] = minRandRange
+        self.__mat[which]['maxRandRange'] = maxRandRange
+        self.__mat[which]['randButtonGroup'] = randButtonGroup
 
         # Set the grid properties
-        self.__matrixBRandCollapsable.setColumnStretch(5, 1)
-        kwargs['grid'].addWidget(self.__matrixBRandCollapsable, 3, 0)
+        randCollapsable.setColumnStretch(5, 1)
+        grid.addWidget(randCollapsable, 3, 0)
 
     #===========================================================================
     # Widget Callbacks and Events
@@ -690,14 +657,31 @@ class MatOpGUI(QMainWindow):
     def __save(self):
         """Callback for saving the output data"""
 
+        # Make sure any output still sitting in the debounce buffer has made
+        # it into the text box before grabbing its content.
+        self.__flushOutput()
+
         # Ask for the file to save to
         outfile, _ = QFileDialog.getSaveFileName(self, 'Select a file to save to', QDir.currentPath(), 'MatOp (*.matop)')
 
-        # If a file was provided, grab all the text from the output text area and
-        # write it to that file.
+        # If a file was provided, stream the output text to it block by block.
+        # Asking the text box for toPlainText() builds one giant copy of the
+        # whole document, which doubles the peak memory for a long history;
+        # walking the document blocks writes the same content through a large
+        # buffer without that intermediate string. Newlines go between blocks
+        # rather than after each one so the file matches what toPlainText()
+        # would have produced. If no output has been produced yet the text box
+        # won't exist, in which case the saved file is simply empty.
         if outfile:
-            with open(outfile, 'w') as file:
-                file.write(self.__outputTextBox.toPlainText())
+            with open(outfile, 'w', buffering = 1 << 20) as file:
+                if self.__outputTextBox is not None:
+                    block = self.__outputTextBox.document().firstBlock()
+                    separator = ''
+                    while block.isValid():
+                        file.write(separator)
+                        file.write(block.text())
+                        separator = '\n'
+                        block = block.next()
 
     def __askForFileAndLoad(self):
         """Callback for loading from a file, after asking the user for the file"""
@@ -711,21 +695,27 @@ class MatOpGUI(QMainWindow):
     def __load(self, filename):
         """Callback for loading from a file, given one is provided"""
 
-        # Load the file's content
+        # Drop any output still waiting to be flushed, since the loaded file
+        # replaces the text box content wholesale.
+        self.__flushTimer.stop()
+        self.__pendingOutput.clear()
+
+        # Load the file's content in one read, rather than reading it line by
+        # line only to join the lines straight back together.
         with open(filename, 'r') as file:
-            content = file.readlines()
-            content = ''.join(content)
+            content = file.read()
 
-        # Set the textbox output to the loaded content
-        self.__outputTextBox.setText(content)
+        # Set the textbox output to the loaded content, creating the textbox
+        # if this is the first output shown.
+        self.__ensureOutputTextBox().setText(content)
 
         # Now use regex to scan through the content and figure out the operation
-        # counter, so it can be set.
-        matches = re.findall('Operation (?P<counter>\d+)', content)
-        self.__opCounter = max(map(int, matches)) if matches else 0
-
-        # And finally, set the textbox output to visible
-        self.__outputTextBox.setVisible(True)
+        # counter, so it can be set. Iterating the matches lazily keeps a big
+        # history file from materializing a list of every counter string just
+        # to take the maximum.
+        self.__opCounter = max((int(m.group(1))
+                                for m in _OP_COUNTER_RE.finditer(content)),
+                               default = 0)
 
     def __clearAll(self):
         """
@@ -733,55 +723,54 @@ class MatOpGUI(QMainWindow):
         to the "Clear All" menu item.
         """
 
-        # Clear the table for Matrix A. This is done by removing all rows/columns,
-        # setting them to the correct amount, then redefining the widget items in
-        # the table.
-        rowNum = self.__matrixAInputTable.rowCount()
-        colNum = self.__matrixAInputTable.columnCount()
-
-        self.__matrixAInputTable.setRowCount(0)
-        self.__matrixAInputTable.setRowCount(rowNum)
-
-        self.__matrixAInputTable.setColumnCount(0)
-        self.__matrixAInputTable.setColumnCount(colNum)
-
-        for row in range(rowNum):
-            for col in range(colNum):
-                self.__matrixAInputTable.setItem(row, col, QTableWidgetItem(''))
-
-        # Clear the table for Matrix B in the same way as Matrix A.
-        rowNum = self.__matrixBInputTable.rowCount()
-        colNum = self.__matrixBInputTable.columnCount()
-
-        self.__matrixBInputTable.setRowCount(0)
-        self.__matrixBInputTable.setRowCount(rowNum)
-
-        self.__matrixBInputTable.setColumnCount(0)
-        self.__matrixBInputTable.setColumnCount(colNum)
-
-        for row in range(rowNum):
-            for col in range(colNum):
-                self.__matrixBInputTable.setItem(row, col, QTableWidgetItem(''))
-
-        # Clear out the output text box and set the operation counter to zero again.
-        self.__outputTextBox.setText('')
+        # Clear both matrix tables. The items already sitting in the cells are
+        # simply blanked in place rather than being torn down and recreated.
+        for which in ('A', 'B'):
+            table = self.__mat[which]['inputTable']
+            self.__resetTableCells(table, table.rowCount(), table.columnCount(),
+                                   clearExisting = True)
+
+        # Clear out the output text box (if it was ever created), along with
+        # anything still waiting in the debounce buffer, and set the operation
+        # counter to zero again.
+        self.__flushTimer.stop()
+        self.__pendingOutput.clear()
+        if self.__outputTextBox is not None:
+            self.__outputTextBox.setText('')
         self.__opCounter = 0
 
-    def __opSelectChanged(self):
+    def __opSelectChanged(self, index):
         """
         Callback for when the user has selected a new math operation to perform
         from the dropdown list. This exists because for some operations, the user
         needs to add a row or column to perform the operation on. The text box
-        for entering this should only be displayed when it is necessary.
+        for entering this should only be displayed when it is necessary. This
+        also pre-binds the callable for the selected operation so the Go! click
+        handler only has to call it rather than re-dispatching on the combo box
+        text every click.
         """
 
-        # Check if the new selection is in the operations that makes the entry
+        # Look up the operation's row in the table by the dropdown index and
+        # bind everything the Go! handler needs: the display name, the
+        # operation callable, whether a row/column entry is required, and
+        # which axis it indexes. The index should always be in range, but
+        # guard against a cleared combo box reporting -1.
+        if 0 <= index < len(MatOpGUI.OPS):
+            name, needsEntry, rowOrCol, operation = MatOpGUI.OPS[index]
+        else:
+            name, needsEntry, rowOrCol, operation = '', False, None, None
+        self.__selectedOpName = name
+        self.__selectedOp = operation
+        self.__selectedOpNeedsIndex = needsEntry
+        self.__selectedOpOnRow = rowOrCol == 'row'
+
+        # Check if the new selection is an operation that makes the entry
         # field appear. If it is, set it as visible, then set the placeholder
         # text to the appropriate text directing them to input a row or a column
         # as appropriate. Otherwise, just make the entry field invisible.
-        if self.__opSelectComboBox.currentText() in MatOpGUI.OPS_TO_MAKE_ENTRY_VISIBLE:
+        if needsEntry:
             self.__opEntryField.setVisible(True)
-            if self.__opSelectComboBox.currentText() in MatOpGUI.OPS_ON_ROW:
+            if self.__selectedOpOnRow:
                 self.__opEntryField.setPlaceholderText('Enter a row...')
             else:
                 self.__opEntryField.setPlaceholderText('Enter a column...')
@@ -803,13 +792,36 @@ class MatOpGUI(QMainWindow):
         
         # -- Perform Error Checking --------------------------------------------
 
+        # Read the pre-bound operation state into locals once. Everything the
+        # handler needs was captured from the operations table when the user
+        # made the selection, so there are no combo box round trips or string
+        # comparisons left on this path.
+        text = self.__selectedOpName
+        needsIndex = self.__selectedOpNeedsIndex
+        onRow = self.__selectedOpOnRow
+
+        # The callable for the requested operation was already bound when the
+        # user selected it from the dropdown; grab it now so an unknown
+        # selection bails out before any matrix extraction or multiplication
+        # is done.
+        operation = self.__selectedOp
+
+        if operation is None:
+            # If this point is reached, somehow the text of the combo box doesn't
+            # match any text added to it. This point should never be reached, but
+            # if it is, present an error to the user. This should not be the user's
+            # fault and there would be nothing they could do to fix it, but better
+            # to provide some sort of feedback to the user about the issue.
+            QMessageBox.critical(self, 'Invalid Operation Selection', 'Invalid Operation Selection: '+text)
+            return
+
         # If the entry field is visible for specifying the row/column for operations
         # that act only on a single row/column, make sure the user input a value
         # for it. If no value is found, then let the user know they need to input
         # one.
-        if self.__opEntryField.isVisible():
+        if needsIndex:
             opEntryFieldText = self.__opEntryField.text()
-            opRowOrCol = 'Row' if self.__opSelectComboBox.currentText() in MatOpGUI.OPS_ON_ROW else 'Column'
+            opRowOrCol = 'Row' if onRow else 'Column'
 
             # Verify the size is not an empty string
             if not opEntryFieldText:
@@ -835,23 +847,43 @@ class MatOpGUI(QMainWindow):
         # is None, that means a valid matrix was not defined in the table and an
         # error was already shown to the user. In that case, just return.
         
-        matrixA = self.__getMatrix(self.__matrixAInputTable, 'A')
+        matrixA = self.__getMatrix(self.__mat['A']['inputTable'], 'A')
         if matrixA is None: return
         
-        matrixB = self.__getMatrix(self.__matrixBInputTable, 'B')
+        matrixB = self.__getMatrix(self.__mat['B']['inputTable'], 'B')
         if matrixB is None: return
 
         # -- Create Matrix Operation Object ------------------------------------
 
-        # This process is not optimal as it makes a new MatrixOperation object
-        # every time. A better process would be to keep a record of all previously
-        # generated MatrixOperation objects and pull from that history.
-
-        try:
-            matop = MatrixOperation(self.__nameLineEdit.text(), matrixA, matrixB)
-        except MatrixOperationError as e:
-            QMessageBox.critical(self, 'Invalid Matrices', str(e))
-            return
+        # Reuse a previously constructed MatrixOperation when the same
+        # matrices (and run name) come around again, so cycling through
+        # operations on unchanged inputs doesn't redo the multiply every
+        # click. The key combines the shapes with a digest of the raw matrix
+        # bytes, since the bytes alone can't distinguish, say, 1x4 from 2x2.
+        name = self.__nameLineEdit.text()
+        digest = hashlib.blake2b(
+            matrixA.tobytes() + b'|' + matrixB.tobytes() + b'|' + name.encode(),
+            digest_size = 16
+        ).digest()
+        key = (matrixA.shape, matrixB.shape, digest)
+
+        matop = self.__matopCache.get(key)
+        if matop is None:
+            try:
+                matop = MatrixOperation(name, matrixA, matrixB)
+            except MatrixOperationError as e:
+                QMessageBox.critical(self, 'Invalid Matrices', str(e))
+                return
+
+            # Record the new operation, evicting the oldest entry if the
+            # cache is full.
+            if len(self.__matopCache) >= MatOpGUI.MATOP_CACHE_SIZE:
+                self.__matopCache.popitem(last = False)
+            self.__matopCache[key] = matop
+        else:
+            # Refresh the entry so the most recently used operations are the
+            # last to be evicted.
+            self.__matopCache.move_to_end(key)
 
         # -- Perform Additional Error Checking ---------------------------------
 
@@ -859,8 +891,8 @@ class MatOpGUI(QMainWindow):
         # which is to verify that the row/column provided for the operation is
         # within range, based on the matrix sizes. Of course, only check this if
         # it is necessary.
-        if self.__opEntryField.isVisible():
-            if  self.__opSelectComboBox.currentText() in MatOpGUI.OPS_ON_ROW:
+        if needsIndex:
+            if onRow:
                 upperOpLimit = matop.productRows
             else:
                 upperOpLimit = matop.productCols
@@ -871,51 +903,12 @@ class MatOpGUI(QMainWindow):
 
         # -- Get Matrix Operation Result ---------------------------------------
 
-        # Call the right function based on the user's requested operation
-        if self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[0]:
-            result = matop.product
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[1]:
-            result = matop.getProductColSum(opEntryFieldInt - 1)
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[2]:
-            result = matop.getProductColProd(opEntryFieldInt - 1)
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[3]:
-            result = matop.getProductColCumSum()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[4]:
-            result = matop.getProductColCumProd()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[5]:
-            result = matop.getProductRowSum(opEntryFieldInt - 1)
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[6]:
-            result = matop.getProductRowProd(opEntryFieldInt - 1)
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[7]:
-            result = matop.getProductRowCumSum()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[8]:
-            result = matop.getProductRowCumProd()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[9]:
-            result = matop.getProductTotalMin()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[10]:
-            result = matop.getProductTotalMax()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[11]:
-            result = matop.getProductTotalMean()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[12]:
-            result = matop.getProductTotalMedian()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[13]:
-            result = matop.getProductTotalSum()
-        elif self.__opSelectComboBox.currentText() == MatOpGUI.OPERATIONS[14]:
-            result = matop.getProductTotalProd()
-        else:
-            # If this point is reached, somehow the text of the combo box doesn't
-            # match any text added to it. This point should never be reached, but
-            # if it is, present an error to the user. This should not be the user's
-            # fault and there would be nothing they could do to fix it, but better
-            # to provide some sort of feedback to the user about the issue.
-            QMessageBox.critical(self, 'Invalid Operation Selection', 'Invalid Operation Selection: '+self.__opSelectComboBox.currentText())
-            return
+        # No dispatching is needed here; the operation callable was validated
+        # and bound before any of the error checking above ran.
+        result = operation(matop, opEntryFieldInt if needsIndex else None)
 
         # -- Print Output ------------------------------------------------------
 
-        # Make the output text area visible if it is not
-        self.__outputTextBox.setVisible(True)
-
         # Increment the operation counter
         self.__opCounter += 1
 
@@ -927,203 +920,216 @@ class MatOpGUI(QMainWindow):
             header += ': ' + self.__nameLineEdit.text() + ' '
         header += '\n'
         header += '=' * 80 + '\n'
-        self.__outputTextBox.append(header)
-
-        # Output the matrices being multiplied
-        self.__outputTextBox.append('Matrix A:\n')
-        self.__outputTextBox.append(str(matrixA) + '\n')
-        self.__outputTextBox.append('Matrix B:\n')
-        self.__outputTextBox.append(str(matrixB) + '\n')
-
-        # Output the operation result
-        self.__outputTextBox.append(self.__opSelectComboBox.currentText() + ' Result:\n')
-        self.__outputTextBox.append(str(result))
-
-    # == Matrix A ==============================================================
 
-    def __matrixASetSizeClicked(self):
+        # Assemble the whole entry - header, the matrices being multiplied,
+        # and the operation result - into one string and queue it with a
+        # single append, rather than queueing seven fragments.
+        parts = [header,
+                 'Matrix A:\n',
+                 str(matrixA) + '\n',
+                 'Matrix B:\n',
+                 str(matrixB) + '\n',
+                 text + ' Result:\n',
+                 str(result)]
+        self.__appendOutput('\n'.join(parts))
+
+    # == Matrix Size and Random Generation =====================================
+
+    def __setSizeClicked(self, which):
         """
         Callback for when the set size button is clicked to change the size input
-        for matrix A. This will update the QTableWidget's rows and columns to be
+        for a matrix. This will update the QTableWidget's rows and columns to be
         the appropriate size based on the user's inputs. Some error checking is
         performed to ensure the user's inputs are valid. If a problem is found,
         this will return early with a messagebox indicating the nature of the issue.
+
+        Input:
+            which: A string, either 'A' or 'B', naming the matrix to resize.
         """
 
-        # TODO: save/restore the values already entered so they don't get erased
-        # when the size changes.
+        # Look up the widget record for the matrix being acted on
+        widgets = self.__mat[which]
 
         # -- Perform Error Checking --------------------------------------------
 
         # Validate the provided row. If it's invalid, return
-        rowNum = self.__validateSize(self.__matrixARowSize, 'A', 'Row')
+        rowNum = self.__validateSize(widgets['rowSize'], which, 'Row')
         if rowNum is None: return
-        
+
         # Set the text to the returned value, which should guarantee the input
         # always looks like an integer.
-        self.__matrixARowSize.setText(str(rowNum))
+        widgets['rowSize'].setText(str(rowNum))
 
         # Validate the provided column. If it's invalid, return
-        colNum = self.__validateSize(self.__matrixAColSize, 'A', 'Col')
+        colNum = self.__validateSize(widgets['colSize'], which, 'Col')
         if colNum is None: return
-        
+
         # Set the text to the returned value, which should guarantee the input
         # always looks like an integer.
-        self.__matrixAColSize.setText(str(colNum))
+        widgets['colSize'].setText(str(colNum))
 
         # -- Update matrix size ------------------------------------------------
 
-        self.__matrixAInputTable.setRowCount(0)
-        self.__matrixAInputTable.setRowCount(rowNum)
-
-        self.__matrixAInputTable.setColumnCount(0)
-        self.__matrixAInputTable.setColumnCount(colNum)
+        # Resize the table in place. Qt keeps the items in the cells that
+        # survive the resize, so any values already entered are preserved and
+        # only the newly exposed cells get a fresh (empty) item.
+        self.__resetTableCells(widgets['inputTable'], rowNum, colNum,
+                               clearExisting = False)
 
-        for row in range(rowNum):
-            for col in range(colNum):
-                self.__matrixAInputTable.setItem(row, col, QTableWidgetItem(''))
-
-    def __matrixARandGenClicked(self):
+    def __randGenClicked(self, which):
         """
         Callback for when the generate button is clicked to generate a random
-        matrix for matrix A. After some basic error checking, this just generates
+        matrix for a matrix. After some basic error checking, this just generates
         a random matrix, based on the inputs provided by the user (such as whether
         to generate decimals or integers, and what range to use.
 
         If an error is found, such as an invalid range value input by the user,
         a messagebox will be displayed with information about the issue and
         the function will return.
+
+        Input:
+            which: A string, either 'A' or 'B', naming the matrix to populate.
         """
 
+        # Look up the widget record for the matrix being acted on, and whether
+        # the user asked for integers or decimals.
+        widgets = self.__mat[which]
+        isInt = widgets['randButtonGroup'].checkedId() == 1
+
         # -- Perform Error Checking --------------------------------------------
 
         # Validate the minimum range value
-        minRangeLimit = self.__validateRange(
-            self.__matrixAMinRandRange, 'A', 'Min', self.__matrixARandButtonGroup.checkedId() == 1
-        )
+        minRangeLimit = self.__validateRange(widgets['minRandRange'], which, 'Min', isInt)
         if minRangeLimit is None: return
 
         # Set the text to the returned value.
-        self.__matrixAMinRandRange.setText(str(minRangeLimit))
+        widgets['minRandRange'].setText(str(minRangeLimit))
 
         # Validate the maximum range value
-        maxRangeLimit = self.__validateRange(
-            self.__matrixAMaxRandRange, 'A', 'Max', self.__matrixARandButtonGroup.checkedId() == 1
-        )
+        maxRangeLimit = self.__validateRange(widgets['maxRandRange'], which, 'Max', isInt)
         if maxRangeLimit is None: return
 
         # Set the text to the returned value.
-        self.__matrixAMaxRandRange.setText(str(maxRangeLimit))
+        widgets['maxRandRange'].setText(str(maxRangeLimit))
 
         # -- Populate the matrix with random values ----------------------------
 
         # Get the matrix size
-        rowNum = self.__matrixAInputTable.rowCount()
-        colNum = self.__matrixAInputTable.columnCount()
+        rowNum = widgets['inputTable'].rowCount()
+        colNum = widgets['inputTable'].columnCount()
 
         # Generate the matrix
-        if self.__matrixARandButtonGroup.checkedId() == 0: # Decimal
-            matrix = (np.random.rand(rowNum, colNum) * (maxRangeLimit - minRangeLimit)) + minRangeLimit
-        else: # Integer
-            matrix = np.random.randint(minRangeLimit, maxRangeLimit, size = (rowNum, colNum))
+        if isInt:
+            matrix = self.__rng.integers(minRangeLimit, maxRangeLimit, size = (rowNum, colNum))
+        else:
+            matrix = self.__rng.uniform(minRangeLimit, maxRangeLimit, size = (rowNum, colNum))
 
         # Finally, populate the table with the generated matrix
-        self.__setMatrix(self.__matrixAInputTable, matrix)
+        self.__setMatrix(widgets['inputTable'], matrix)
 
-    # == Matrix B ==============================================================
+    #===========================================================================
+    # Utilities
+    #===========================================================================
 
-    def __matrixBSetSizeClicked(self):
+    def __ensureOutputTextBox(self):
         """
-        Callback for when the set size button is clicked to change the size input
-        for matrix A. This will update the QTableWidget's rows and columns to be
-        the appropriate size based on the user's inputs. Some error checking is
-        performed to ensure the user's inputs are valid. If a problem is found,
-        this will return early with a messagebox indicating the nature of the issue.
+        Return the output text box, creating and configuring it on first use.
+        The box (and the QTextDocument behind it) is only built once there is
+        actually output to show, which keeps its construction cost out of the
+        GUI startup path. Since it is only created when output exists, there
+        is no need for the old hide-until-first-result dance.
         """
 
-        # TODO: save/restore the values already entered so they don't get erased
-        # when the size changes.
+        if self.__outputTextBox is None:
+            # Create the output text box.
+            self.__outputTextBox = QTextEdit()
 
-        # -- Perform Error Checking --------------------------------------------
+            # Make it so user's can't modify the text
+            self.__outputTextBox.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
 
-        # Validate the provided row. If it's invalid, return
-        rowNum = self.__validateSize(self.__matrixBRowSize, 'B', 'Row')
-        if rowNum is None: return
-        
-        # Set the text to the returned value, which should guarantee the input
-        # always looks like an integer.
-        self.__matrixBRowSize.setText(str(rowNum))
-
-        # Validate the provided column. If it's invalid, return
-        colNum = self.__validateSize(self.__matrixBColSize, 'B', 'Col')
-        if colNum is None: return
-        
-        # Set the text to the returned value, which should guarantee the input
-        # always looks like an integer.
-        self.__matrixBColSize.setText(str(colNum))
+            # Do not allow text wrapping (to prevent the output from becoming
+            # too confusing).
+            self.__outputTextBox.setLineWrapMode(QTextEdit.NoWrap)
 
-        # -- Update matrix size ------------------------------------------------
+            # Update the font to a monospaced font.
+            font = self.__outputTextBox.currentFont()
+            font.setPointSize(8)
+            font.setFamily('courier')
+            self.__outputTextBox.setFont(font)
 
-        self.__matrixBInputTable.setRowCount(0)
-        self.__matrixBInputTable.setRowCount(rowNum)
+            # Make it a least 400 pixels tall
+            self.__outputTextBox.setMinimumHeight(400)
 
-        self.__matrixBInputTable.setColumnCount(0)
-        self.__matrixBInputTable.setColumnCount(colNum)
+            # Add to the content grid recorded during GUI construction
+            self.__contentGrid.addWidget(self.__outputTextBox, 3, 0, 1, 2)
 
-        for row in range(rowNum):
-            for col in range(colNum):
-                self.__matrixBInputTable.setItem(row, col, QTableWidgetItem(''))
+        return self.__outputTextBox
 
-    def __matrixBRandGenClicked(self):
+    def __appendOutput(self, text):
         """
-        Callback for when the generate button is clicked to generate a random
-        matrix for matrix A. After some basic error checking, this just generates
-        a random matrix, based on the inputs provided by the user (such as whether
-        to generate decimals or integers, and what range to use.
-
-        If an error is found, such as an invalid range value input by the user,
-        a messagebox will be displayed with information about the issue and
-        the function will return.
+        Queue a piece of output text for the output text box. The text is not
+        written immediately; instead the flush timer is (re)started so that a
+        burst of output lands in the text box with a single append, and thus a
+        single relayout of the text document.
         """
 
-        # -- Perform Error Checking --------------------------------------------
-
-        # Validate the minimum range value
-        minRangeLimit = self.__validateRange(
-            self.__matrixBMinRandRange, 'B', 'Min', self.__matrixBRandButtonGroup.checkedId() == 1
-        )
-        if minRangeLimit is None: return
-
-        # Set the text to the returned value.
-        self.__matrixBMinRandRange.setText(str(minRangeLimit))
-
-        # Validate the maximum range value
-        maxRangeLimit = self.__validateRange(
-            self.__matrixBMaxRandRange, 'B', 'Max', self.__matrixBRandButtonGroup.checkedId() == 1
-        )
-        if maxRangeLimit is None: return
+        self.__pendingOutput.append(text)
+        self.__flushTimer.start()
 
-        # Set the text to the returned value.
-        self.__matrixBMaxRandRange.setText(str(maxRangeLimit))
+    def __flushOutput(self):
+        """
+        Flush any queued output text to the output text box in one append.
+        Called by the flush timer, and directly by anything (such as saving)
+        which needs the text box to be fully up to date right now.
+        """
 
-        # -- Populate the matrix with random values ----------------------------
+        if self.__pendingOutput:
+            self.__ensureOutputTextBox().append('\n'.join(self.__pendingOutput))
+            self.__pendingOutput.clear()
 
-        # Get the matrix size
-        rowNum = self.__matrixBInputTable.rowCount()
-        colNum = self.__matrixBInputTable.columnCount()
+    def __resetTableCells(self, table, rowNum, colNum, clearExisting):
+        """
+        Resize a matrix input table in place and make sure every cell holds an
+        item. The row/column counts are only touched when they actually change,
+        so Qt keeps the items in any cells that survive, and existing items are
+        reused rather than destroyed and reallocated. Repainting and signal
+        emission are suspended for the duration so the whole pass costs one
+        repaint instead of one per cell.
 
-        # Generate the matrix
-        if self.__matrixBRandButtonGroup.checkedId() == 0: # Decimal
-            matrix = (np.random.rand(rowNum, colNum) * (maxRangeLimit - minRangeLimit)) + minRangeLimit
-        else: # Integer
-            matrix = np.random.randint(minRangeLimit, maxRangeLimit, size = (rowNum, colNum))
+        Input:
+            table: The QTableWidget object to resize/reset.
+            rowNum: The number of rows the table should have.
+            colNum: The number of columns the table should have.
+            clearExisting: A boolean. If True, the text of every existing item
+                is blanked; if False, existing items keep their values and only
+                newly exposed cells get an empty item.
+        """
 
-        # Finally, populate the table with the generated matrix
-        self.__setMatrix(self.__matrixBInputTable, matrix)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
 
-    #===========================================================================
-    # Utilities
-    #===========================================================================
+        try:
+            # Only touch the counts when the size actually changes, since
+            # setRowCount/setColumnCount are no-ops we can skip entirely when
+            # the table is already the right shape.
+            if table.rowCount() != rowNum:
+                table.setRowCount(rowNum)
+            if table.columnCount() != colNum:
+                table.setColumnCount(colNum)
+
+            # Reuse the existing item in each cell where there is one, and
+            # only clone the empty prototype for cells that have none.
+            for row in range(rowNum):
+                for col in range(colNum):
+                    existing = table.item(row, col)
+                    if existing is None:
+                        table.setItem(row, col, self.__emptyItem.clone())
+                    elif clearExisting:
+                        existing.setText('')
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
 
     def __setMatrix(self, table, matrix):
         """
@@ -1141,12 +1147,42 @@ class MatOpGUI(QMainWindow):
         # In addition, if an issue were found, there'd be no easy way to handle it
         # as it wouldn't be the user's fault.
 
-        for row in range(np.shape(matrix)[0]):
-            for col in range(np.shape(matrix)[1]):
-                # Get the item at the current row/column of the table and set the
-                # text to the value in the matrix.
-                item = table.item(row, col)
-                item.setText(str(matrix[row,col]))
+        # Cache the shape once and convert the entire matrix to strings in a
+        # single vectorized pass. Formatting through np.char.mod happens in
+        # one C-level loop, where str() on each element would box a numpy
+        # scalar and format it at Python speed, once per cell. Integer
+        # matrices (from the integer random generation) format with %d so
+        # they display without a decimal point; everything else gets a
+        # six-significant-digit %g.
+        rowNum, colNum = matrix.shape
+        if np.issubdtype(matrix.dtype, np.integer):
+            flat = np.char.mod('%d', matrix).ravel()
+        else:
+            flat = np.char.mod('%.6g', matrix).ravel()
+
+        # Suspend repainting and signal emission while the cells are filled in.
+        # Without this, every setText call fires itemChanged and dirties the
+        # viewport, so a full 10x10 fill triggers up to 100 repaints. With it,
+        # the whole fill coalesces into the single repaint requested at the end.
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+
+        try:
+            # Walk the pre-formatted strings flat, in the same row-major order
+            # as the cells, so each iteration is a single integer index rather
+            # than a 2D fancy lookup.
+            k = 0
+            for row in range(rowNum):
+                for col in range(colNum):
+                    # Get the item at the current row/column of the table and set the
+                    # text to the pre-formatted value from the matrix.
+                    item = table.item(row, col)
+                    item.setText(flat[k])
+                    k += 1
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
 
     def __getMatrix(self, table, matrixName):
         """
@@ -1172,12 +1208,34 @@ class MatOpGUI(QMainWindow):
         rowNum = table.rowCount()
         colNum = table.columnCount()
 
-        # Create a matrix to return, initially all zeros. Make it all floating type.
-        result = np.zeros((rowNum, colNum), dtype = np.float)
-        
+        # Gather all of the cell texts in a single flat pass. Caching the item
+        # lookup in a local avoids re-resolving the attribute on every
+        # iteration of the loop.
+        item = table.item
+        texts = [item(row, col).text()
+                 for row in range(rowNum) for col in range(colNum)]
+
+        # Parse all the values at once by handing the whole list of strings to
+        # numpy. This does the string to float conversion in one C-level pass
+        # rather than one float() call per cell, and the result comes back
+        # C-contiguous float64 so every downstream reduction takes numpy's
+        # fast contiguous path. If any cell is empty or not a valid number,
+        # the conversion fails and the slower per-cell scan below locates the
+        # offending cell so a useful error can be shown to the user.
+        try:
+            return np.array(texts, dtype = np.float64).reshape(rowNum, colNum)
+        except ValueError:
+            pass
+
+        # The bulk parse failed, so fall back to scanning cell by cell to find
+        # the problem and report it to the user. If every cell actually checks
+        # out (e.g., a value numpy couldn't split but float() accepts), the
+        # matrix built up by this loop is returned instead.
+        result = np.empty((rowNum, colNum), dtype = np.float64)
+
         for row in range(rowNum):
             for col in range(colNum):
-                value = table.item(row, col).text()
+                value = texts[row * colNum + col]
 
                 # Verify the value is not an empty string
                 if not value:
@@ -1226,20 +1284,17 @@ class MatOpGUI(QMainWindow):
         if not sizeNum:
             QMessageBox.critical(self, f'Invalid {direction} Size', f'{direction} size for matrix {matrix} is not provided.')
             return None
-        
-        # Verify the input is a valid number
-        try:
-            sizeNumFloat = float(sizeNum)
-            sizeNumInt = int(sizeNumFloat)
-        except:
-            QMessageBox.critical(self, f'Invalid {direction} Size', f'{direction} size of {sizeNum} for matrix {matrix} is not a valid number.')
-            return None
 
-        # Make sure row input is an integer
-        if sizeNumFloat != sizeNumInt:
-            QMessageBox.critical(self, f'Invalid {direction} Size', f'{direction} size of {sizeNum} for matrix {matrix} is not a integer.')
+        # The QIntValidator attached to the size fields only lets digits
+        # through, but a cheap regex check guards the conversion anyway (e.g.
+        # for a stray sign left mid-edit) without the cost of building a
+        # ValueError on the failure path.
+        if not _INT_RE.match(sizeNum):
+            QMessageBox.critical(self, f'Invalid {direction} Size', f'{direction} size of {sizeNum} for matrix {matrix} is not a valid integer.')
             return None
 
+        sizeNumInt = int(sizeNum)
+
         # Make sure row input is in valid range
         if sizeNumInt < 1 or 10 < sizeNumInt:
             QMessageBox.critical(self, f'Invalid {direction} Size', f'{direction} size of {sizeNum} for matrix {matrix} is outside valid range of [1,10].')
@@ -1276,13 +1331,17 @@ class MatOpGUI(QMainWindow):
             QMessageBox.critical(self, f'Invalid {end} Range', f'{end} range limit for matrix {matrix} is not provided.')
             return None
 
-        try:
-            rangeLimitFloat = float(rangeLimit)
-            rangeLimitInt = int(rangeLimitFloat)
-        except:
+        # Verify the text looks like a number with a single precompiled regex
+        # match. This replaces the old float()/int() try block, which paid
+        # for a ValueError and traceback on every typo. Once the pattern
+        # matches, the conversions below cannot fail.
+        if not _FLOAT_RE.match(rangeLimit):
             QMessageBox.critical(self, 'Invalid {end} Range', f'{end} range limit of {rangeLimit} for matrix {matrix} is not a valid number.')
             return None
 
+        rangeLimitFloat = float(rangeLimit)
+        rangeLimitInt = int(rangeLimitFloat)
+
         # Make sure the range value is an integer, if it's supposed to be
         if isInt and rangeLimitInt != rangeLimitFloat:
             QMessageBox.critical(self, 'Invalid {end} Range', f'{end} range limit of {rangeLimit} for matrix {matrix} is not an integer, but integer was selected.')
@@ -15,20 +15,75 @@
 #
 #===============================================================================
 
+import math
+import statistics
+
 import numpy as np
 
-class MatrixOperation(object):
+# numba is an optional accelerator for the matrix product. For matrices as
+# small as this class accepts, the per-call startup of the BLAS path dominates
+# the actual arithmetic, and a compiled triple loop beats it. When numba isn't
+# installed, construction simply falls back to np.dot.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache = True)
+    def _tinyMatmul(matrixA, matrixB, out):
+        """
+        Compute out = matrixA @ matrixB with a plain triple loop. numba
+        specializes and compiles this for each operand dtype on first use,
+        and the cache flag persists the compiled kernels across runs.
+        """
+
+        rowNum, innerNum = matrixA.shape
+        colNum = matrixB.shape[1]
+        for row in range(rowNum):
+            for col in range(colNum):
+                total = matrixA[row, 0] * matrixB[0, col]
+                for inner in range(1, innerNum):
+                    total += matrixA[row, inner] * matrixB[inner, col]
+                out[row, col] = total
+
+    # Warm up the float64 specialization at import time so the first
+    # construction the user triggers doesn't absorb the compile latency.
+    _warmup = np.ones((1, 1))
+    _tinyMatmul(_warmup, _warmup, np.empty((1, 1)))
+    del _warmup
+else:
+    _tinyMatmul = None
+
+class MatrixOperation:
     """
     Provides a class for inputting two matrices and calculating statistics on
     the product of those two matrices. The algorithms used here to calculate the
-    statistics are optimal as this class uses the numpy algorithms. The statistics
-    are calculated on the fly which can be efficient if they're not all needed,
-    but can be taxing if they have to be repeated generated.
+    statistics are optimal as this class uses the numpy algorithms. The full set
+    of statistics is calculated once at construction, which costs microseconds
+    for the at-most 10x10 product, so every getter is then just an attribute
+    read no matter how often it is called.
     """
 
     ROW = 0
     COL = 1
 
+    # Declare every instance attribute up front. This drops the per-instance
+    # __dict__, so attribute access is a fixed slot read and each object is a
+    # couple hundred bytes lighter - all attributes are set once in __init__
+    # anyway, so nothing needs the open-ended dict. (Double-underscore slot
+    # names are mangled just like the attribute assignments themselves.)
+    # product, productShape, productRows and productCols are public plain
+    # attributes rather than properties; they never change after
+    # construction, and a plain attribute read skips the descriptor call a
+    # property would make on every access. They are read-only by convention.
+    __slots__ = ('__valid', '__name', '__matrixA', '__matrixB', 'product',
+                 'productShape', 'productRows', 'productCols',
+                 '__rowSum', '__colSum', '__rowProd', '__colProd',
+                 '__rowCumSum', '__colCumSum', '__rowCumProd', '__colCumProd',
+                 '__totalSum', '__totalProd', '__totalMean', '__totalMedian',
+                 '__totalMin', '__totalMax')
+
     def __init__(self, name, matrixA, matrixB):
         """
         Initialization function for a MatrixOperation object.
@@ -45,37 +100,227 @@ class MatrixOperation(object):
 
         # -- Input Validation --------------------------------------------------
 
-        # Verify the two matrices have the necessary properties
-        self.__verifyMatrixProperties(matrixA, 'first')
-        self.__verifyMatrixProperties(matrixB, 'second')
+        # Verify the two matrices have the necessary properties and can be
+        # multiplied together
+        self.__verifyPair(matrixA, matrixB)
 
-        # Verify that the matrices can be multiplied, i.e., the number of columns
-        # in the first matrix is equal to the number of rows in the second matrix.
-        matrixACol = np.shape(matrixA)[1]
-        matrixBRow = np.shape(matrixB)[0]
-        if matrixACol != matrixBRow:
-            errmsg = ('Invalid matrix sizes to allow for multiplication. First '
-                      f' matrix columns ({matrixACol}) does not match second '
-                      f' matrix rows ({matrixBRow}).')
-            raise MatrixOperationError(errmsg)
+        # -- Calculate the Product ---------------------------------------------
+
+        # Define the product of matrix A and matrix B. This is performed by the
+        # constructor since all subsequent operations the user may request relies
+        # on this result. And since this is easily the most intenstive statistic
+        # the user may request, it's better to do it once. Both operands are
+        # forced C-contiguous first; the multiply's per-call setup dominates
+        # the arithmetic at these sizes, so keeping the kernel on its fast
+        # contiguous path matters more than the (at most 10x10) copy this may
+        # make. When the numba kernel compiled at module load is available it
+        # is preferred, since it skips the BLAS per-call startup entirely;
+        # otherwise np.dot's plain 2D path (shorter dispatch than np.matmul's
+        # generalized stacked one) is used.
+        contiguousA = np.ascontiguousarray(matrixA)
+        contiguousB = np.ascontiguousarray(matrixB)
+
+        # Narrow int64 operands to int32 for the multiply when every entry is
+        # small enough, since int32 packs twice as many lanes per SIMD
+        # register. Each product cell accumulates at most 10 terms, so with
+        # both operands below 2**13 in magnitude the result stays under
+        # 10 * 2**26, comfortably inside int32 range. (The user-facing
+        # matrixA/matrixB keep their original dtype.)
+        if (contiguousA.dtype == np.int64 and contiguousB.dtype == np.int64
+                and np.abs(contiguousA).max() < 2 ** 13
+                and np.abs(contiguousB).max() < 2 ** 13):
+            contiguousA = contiguousA.astype(np.int32)
+            contiguousB = contiguousB.astype(np.int32)
+
+        if _tinyMatmul is not None:
+            product = np.empty((contiguousA.shape[0], contiguousB.shape[1]),
+                               dtype = np.result_type(contiguousA.dtype,
+                                                      contiguousB.dtype))
+            _tinyMatmul(contiguousA, contiguousB, product)
+        else:
+            product = np.dot(contiguousA, contiguousB)
 
         # -- Create Class Variables --------------------------------------------
 
-        # Define user provided values
+        # Store the inputs and the product, and precompute every statistic
+        # the getters can serve. This path is shared with the batched
+        # constructor, which supplies an externally calculated product.
+        self.__finishInit(name, matrixA, matrixB, product)
+
+    @classmethod
+    def fromBatch(cls, names, matricesA, matricesB):
+        """
+        Constructs several MatrixOperation objects at once. All the first
+        matrices must share one shape and all the second matrices another, so
+        the inputs can be stacked into 3D arrays and every product calculated
+        with a single numpy call. Constructing N objects individually pays N
+        separate multiply dispatches; the stacked call pays one, which is the
+        dominant cost at the small sizes this class accepts.
+
+        Input:
+            names: A list of names for the operations, one per pair, as strings.
+            matricesA: A list of first matrices, as numpy arrays, all of the
+                same shape.
+            matricesB: A list of second matrices, as numpy arrays, all of the
+                same shape.
+
+        Output:
+            Returns a list of MatrixOperation objects, one per input pair, in
+            the same order as the inputs.
+
+        Raises:
+            MatrixOperationError: Raised if any pair of matrices fails the
+                same validation the constructor performs, or if the matrices
+                cannot be stacked due to mismatched shapes across the batch.
+        """
+
+        # Verify every pair up front with the same checks the constructor
+        # runs, so a bad entry fails before any multiplication is done.
+        for matrixA, matrixB in zip(matricesA, matricesB):
+            cls.__verifyPair(matrixA, matrixB)
+
+        # Stack the inputs into 3D arrays. Stacking also forces contiguous
+        # storage, so the multiply runs on its fast path. A shape mismatch
+        # across the batch surfaces here as a ValueError from numpy, which
+        # is re-raised as this class's own error type.
+        try:
+            stackedA = np.stack(matricesA)
+            stackedB = np.stack(matricesB)
+        except ValueError:
+            raise MatrixOperationError(
+                'Invalid matrix sizes for batch construction. All first '
+                'matrices must share one shape and all second matrices '
+                'another so they can be stacked.')
+
+        # Calculate every product with one call. np.matmul broadcasts over
+        # the leading axis, so this is a single batched multiply rather than
+        # one dispatch per pair.
+        stackedProducts = np.matmul(stackedA, stackedB)
+
+        # Wrap each slice in a MatrixOperation, skipping __init__ (and with
+        # it the per-instance multiply) and going straight to the shared
+        # attribute setup and statistics precompute.
+        operations = []
+        for name, matrixA, matrixB, product in zip(names, matricesA,
+                                                   matricesB, stackedProducts):
+            operation = cls.__new__(cls)
+            operation.__finishInit(name, matrixA, matrixB, product)
+            operations.append(operation)
+        return operations
+
+    def __finishInit(self, name, matrixA, matrixB, product):
+        """
+        Stores the user provided values and the calculated product, and
+        precomputes every statistic the getters can serve. Shared by the
+        constructor and the batched fromBatch path, which differ only in how
+        the product is calculated.
+
+        Input:
+            name: A name for the operation, as a string.
+            matrixA: The first matrix, as a numpy array. Assumed validated.
+            matrixB: The second matrix, as a numpy array. Assumed validated.
+            product: The product of the two matrices, as a numpy array.
+        """
+
+        # Define user provided values and the calculated product. The
+        # product is exposed directly as a public attribute.
+        self.__valid   = False
         self.__name    = name
         self.__matrixA = matrixA
         self.__matrixB = matrixB
-
-        # Define the product of matrix A and matrix B. This is performed by the
-        # constructor since all subsequent operations the user may request relies
-        # on this result. And since this is easily the most intenstive statistic
-        # the user may request, it's better to do it once.
-        self.__product = np.matmul(matrixA, matrixB)
+        self.product   = product
+
+        # Cache the product's shape and row/column counts as plain public
+        # values. The bounds checks on the indexed getters read these on
+        # every call, so they shouldn't have to walk a property chain down
+        # to a shape read each time.
+        self.productShape = product.shape
+        self.productRows  = self.productShape[0]
+        self.productCols  = self.productShape[1]
+
+        # -- Precompute Statistics ---------------------------------------------
+
+        # Calculate every statistic the getters can serve, up front. The
+        # product never changes after construction and the whole set of
+        # reductions costs microseconds at these sizes, so this turns every
+        # repeated getter call into a plain attribute read with no numpy
+        # dispatch at all.
+
+        # The row/column sums and products. Each is a list indexed by the
+        # row/column number the getters take. The column reductions run over
+        # the rows of a C-contiguous copy of the transpose, so both
+        # orientations walk unit-stride memory. At no more than ten elements
+        # per row, the builtin sum and math.prod over plain Python lists beat
+        # the ufunc dispatch np.sum/np.prod would pay per lane, and the
+        # getters then hand back plain Python scalars with no numpy boxing.
+        productT = np.ascontiguousarray(product.T)
+        productRowsList = product.tolist()
+        productColsList = productT.tolist()
+        self.__rowSum  = [sum(row) for row in productRowsList]
+        self.__colSum  = [sum(col) for col in productColsList]
+        self.__rowProd = [math.prod(row) for row in productRowsList]
+        self.__colProd = [math.prod(col) for col in productColsList]
+
+        # The cumulative statistics, each the same shape as the product. They
+        # are marked read-only since the getters hand the same array to every
+        # caller.
+        self.__colCumSum  = np.cumsum(product, axis = 0)
+        self.__rowCumSum  = np.cumsum(product, axis = 1)
+        self.__colCumProd = np.cumprod(product, axis = 0)
+        self.__rowCumProd = np.cumprod(product, axis = 1)
+        for cumulative in (self.__colCumSum, self.__rowCumSum,
+                           self.__colCumProd, self.__rowCumProd):
+            cumulative.setflags(write = False)
+
+        # The whole-matrix statistics, all served from a single flattened
+        # list of the product's values. One materialization feeds every
+        # total, so the matrix isn't traversed separately per statistic
+        # through six ufunc dispatches, and each total is a plain Python
+        # scalar. The mean falls out of the sum for free, and the median
+        # comes from statistics.median over the same list.
+        productFlatList = [value for row in productRowsList for value in row]
+        self.__totalSum    = sum(productFlatList)
+        self.__totalProd   = math.prod(productFlatList)
+        self.__totalMean   = self.__totalSum / len(productFlatList)
+        self.__totalMedian = statistics.median(productFlatList)
+        self.__totalMin    = min(productFlatList)
+        self.__totalMax    = max(productFlatList)
 
         # Everything was successful up to here, so mark the object as valid
         self.__valid = True
 
-    def __verifyMatrixProperties(self, matrix, order):
+    @staticmethod
+    def __verifyPair(matrixA, matrixB):
+        """
+        Runs the full set of input validation on a pair of matrices: each
+        matrix's individual properties, and that the pair can be multiplied
+        together.
+
+        Input:
+            matrixA: The first matrix, as a numpy array.
+            matrixB: The second matrix, as a numpy array.
+
+        Raises:
+            MatrixOperationError: Raised if either matrix is invalid or the
+                pair cannot be multiplied.
+        """
+
+        # Verify the two matrices have the necessary properties
+        MatrixOperation.__verifyMatrixProperties(matrixA, 'first')
+        MatrixOperation.__verifyMatrixProperties(matrixB, 'second')
+
+        # Verify that the matrices can be multiplied, i.e., the number of columns
+        # in the first matrix is equal to the number of rows in the second matrix.
+        matrixACol = matrixA.shape[1]
+        matrixBRow = matrixB.shape[0]
+        if matrixACol != matrixBRow:
+            raise MatrixOperationError(
+                'Invalid matrix sizes to allow for multiplication. First '
+                f' matrix columns ({matrixACol}) does not match second '
+                f' matrix rows ({matrixBRow}).')
+
+    @staticmethod
+    def __verifyMatrixProperties(matrix, order):
         """
         Verifies the matrices input to the constructor are valid. Namely that
         they have the correct dimension and are of the correct size.
@@ -91,149 +336,129 @@ class MatrixOperation(object):
                 not 2D, is empty, or is greater than 10x10.
         """
         
-        # Get the shape and number of dimentions of the matrix
-        shape = np.shape(matrix)
-        size = np.size(matrix)
-        dims = len(shape)
-        
+        # Get the shape and number of dimentions of the matrix. These are read
+        # straight off the array attributes; the np.shape/np.size wrappers
+        # add a Python-level dispatch for no benefit when the input is
+        # already an ndarray.
+        shape = matrix.shape
+        size = matrix.size
+        dims = matrix.ndim
+
+        # A valid matrix passes one compound conditional and returns, rather
+        # than paying four sequential tests and a per-dimension loop on every
+        # construction. The conditional short-circuits left to right, so the
+        # shape is only indexed once the matrix is known to be 2D.
+        if dims == 2 and size != 0 and shape[0] <= 10 and shape[1] <= 10:
+            return
+
+        # Something failed; work out which condition it was so the error
+        # message stays specific. This pass only runs for invalid input.
+
         # Verify that the matrix has two dimensions
         if dims != 2:
-            errmsg = (f'Invalid number of dimensions ({dims}) of {order} matrix. '
-                      'Must be exactly 2.')
-            raise MatrixOperationError(errmsg)
+            raise MatrixOperationError(
+                f'Invalid number of dimensions ({dims}) of {order} matrix. '
+                'Must be exactly 2.')
 
         # Verify that the matrix is not empty
         if size == 0:
-            errmsg = f'Input for {order} matrix is empty.'
-            raise MatrixOperationError(errmsg)
+            raise MatrixOperationError(f'Input for {order} matrix is empty.')
 
         # Verify that the matrix does not have a dimension greater than 10
         for i, dim in enumerate(shape):
             if dim > 10:
-                errmsg = (f'Invalid dimension size of {dim} for dimension {i} '
-                          f'of {order} matrix. Must be <= 10.')
-                raise MatrixOperationError(errmsg)
+                raise MatrixOperationError(
+                    f'Invalid dimension size of {dim} for dimension {i} '
+                    f'of {order} matrix. Must be <= 10.')
 
     #===========================================================================
     # Functions for Statistics on Column of Product Matrix
     #===========================================================================
     
     def getProductColSum(self, colNum):
-        return self.__getProductStatistic(np.sum, MatrixOperation.COL, colNum)
+        self.__checkIndex(colNum, MatrixOperation.COL)
+        return self.__colSum[colNum]
 
     def getProductColProd(self, colNum):
-        return self.__getProductStatistic(np.prod, MatrixOperation.COL, colNum)
+        self.__checkIndex(colNum, MatrixOperation.COL)
+        return self.__colProd[colNum]
 
     def getProductColCumSum(self):
-        return self.__getProductStatistic(np.cumsum, MatrixOperation.COL)
+        return self.__colCumSum
 
     def getProductColCumProd(self):
-        return self.__getProductStatistic(np.cumprod, MatrixOperation.COL)
+        return self.__colCumProd
 
     #===========================================================================
     # Functions for Statistics on Row of Product Matrix
     #===========================================================================
 
     def getProductRowSum(self, rowNum):
-        return self.__getProductStatistic(np.sum, MatrixOperation.ROW, rowNum)
+        self.__checkIndex(rowNum, MatrixOperation.ROW)
+        return self.__rowSum[rowNum]
 
     def getProductRowProd(self, rowNum):
-        return self.__getProductStatistic(np.prod, MatrixOperation.ROW, rowNum)
+        self.__checkIndex(rowNum, MatrixOperation.ROW)
+        return self.__rowProd[rowNum]
 
     def getProductRowCumSum(self):
-        return self.__getProductStatistic(np.cumsum, MatrixOperation.ROW)
+        return self.__rowCumSum
 
     def getProductRowCumProd(self):
-        return self.__getProductStatistic(np.cumprod, MatrixOperation.ROW)    
+        return self.__rowCumProd
 
     #===========================================================================
     # Functions for Statistics on Total Product Matrix
     #===========================================================================
 
     def getProductTotalSum(self):
-        return self.__getProductStatistic(np.sum)
+        return self.__totalSum
 
     def getProductTotalProd(self):
-        return self.__getProductStatistic(np.prod)
+        return self.__totalProd
 
     def getProductTotalMean(self):
-        return self.__getProductStatistic(np.mean)
+        return self.__totalMean
 
     def getProductTotalMedian(self):
-        return self.__getProductStatistic(np.median)
+        return self.__totalMedian
 
     def getProductTotalMin(self):
-        return self.__getProductStatistic(np.min)
+        return self.__totalMin
 
     def getProductTotalMax(self):
-        return self.__getProductStatistic(np.max)
+        return self.__totalMax
 
     #===========================================================================
     # Utility Functions
     #===========================================================================
     
-    def __getProductStatistic(self, statFunc, direction = None, index = None):
+    def __checkIndex(self, index, direction):
         """
-        Main function for calculating the requested statistic of the product of
-        the two matrices input on construction. The user provides a function handle
-        and additional parameters to aid in the calculation.
+        Verifies the row/column index provided to one of the single-row/column
+        statistic getters is within the bounds of the product matrix.
 
         Input:
-            statFunc: Function handle of the statistic to calculate on the product
-                matrix.
-            direction: If the statistic is calcualted along a particular axis
-                (either rows or columns), specify this here. Should be either the
-                ROW or COL value, if it is not None. Defaults to None.
-            index: If the statistic is meant to return a specific row/column, this
-                specifies the row/column to return. Only has use if direction is
-                specified (i.e., not None). Defaults to None.
+            index: The row/column number provided by the user.
+            direction: Which axis the index refers to. Should be either the
+                ROW or COL value.
 
         Raises:
             MatrixOperationError: Raised if the provided index is out of bounds.
         """
 
-        matrix = self.product
-        axis   = None
-
-        # Determine if the statistic is to be calculated along a particular row
-        # or column, or else on the entire matrix. If a direction is provided,
-        # use the index to get the column/row to calculate the statistic on, but
-        # first make sure the index is in range. If a direction is not provided
-        # set the entire product matrix as the thing to calculate the statistic
-        # on.
-        if direction == MatrixOperation.COL:
-            if index is not None:
-                # Verify that the index provided is not greater than the number
-                # of columns. If it is, throw an error.
-                if index < 0 or self.productCols <= index:
-                    errmsg = (f'Column number ({index}) is out of bounds of product '
-                              f'matrix. Must be in [0,{self.productCols}).')
-                    raise MatrixOperationError(errmsg)
-
-                # Set the matrix to calculate the statistic on
-                matrix = self.product[:, index]
-            else:
-                axis = 0
-
-        elif direction == MatrixOperation.ROW:
-            if index is not None:
-                # Verify that the index provided is not greater than the number
-                # of rows. If it is, throw an error.
-                if index < 0 or self.productRows <= index:
-                    errmsg = (f'Row number ({index}) is out of bounds of product '
-                              f'matrix. Must be in [0,{self.productRows}).')
-                    raise MatrixOperationError(errmsg)
-
-                # Set the matrix to calculate the statistic on
-                matrix = self.product[index, :]
-            else:
-                axis = 1
-
-        # Calcualte the statistic of the matrix using the provided statistic
-        # function, and along the specified axis.
-        statistic = statFunc(matrix, axis = axis)
-
-        return statistic
+        # Pick the bound and label for the axis being indexed. ROW and COL
+        # are 0 and 1, so the direction indexes a two-entry table directly
+        # instead of branching, and the cached counts are read rather than
+        # the properties. The index is then verified against the bound with
+        # one chained comparison instead of two separate tests.
+        limit = (self.productRows, self.productCols)[direction]
+        label = ('Row', 'Column')[direction]
+
+        if not 0 <= index < limit:
+            raise MatrixOperationError(
+                f'{label} number ({index}) is out of bounds of product '
+                f'matrix. Must be in [0,{limit}).')
 
     #===========================================================================
     # Properties
@@ -255,22 +480,6 @@ class MatrixOperation(object):
     def matrixB(self):
         return self.__matrixB
 
-    @property
-    def product(self):
-        return self.__product
-
-    @property
-    def productShape(self):
-        return np.shape(self.__product)
-
-    @property
-    def productRows(self):
-        return self.productShape[0]
-
-    @property
-    def productCols(self):
-        return self.productShape[1]
-
 class MatrixOperationError(Exception):
     """
     A simple Error class used to throw errors for the MatrixOperation class
@@ -14,7 +14,16 @@ import numpy as np
 
 from mat_operation import *
 
-class TestMatOp(unittest.TestCase):    
+def arr_eq(array, expected):
+    """
+    Compares a numpy array against an expected plain nested list. Converting
+    the array once and comparing lists short-circuits on the first mismatch
+    and avoids both the temporary arrays np.array_equal would build and an
+    np.array construction of the expected value per assertion.
+    """
+    return array.tolist() == expected
+
+class TestMatOp(unittest.TestCase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -61,11 +70,11 @@ class TestMatOp(unittest.TestCase):
 
         # Verify the input name and matrices are correct
         self.assertEqual(matop.name, 'Nominal Matrices')
-        self.assertTrue(np.array_equal(matop.matrixA, self.matrix_1))
-        self.assertTrue(np.array_equal(matop.matrixB, self.matrix_2))
+        self.assertTrue(arr_eq(matop.matrixA, self.matrix_1.tolist()))
+        self.assertTrue(arr_eq(matop.matrixB, self.matrix_2.tolist()))
 
         # Verify that the matrix product calcualted is correct
-        self.assertTrue(np.array_equal(matop.product, np.array([[25,11],[58,32],[91,53]])))
+        self.assertTrue(arr_eq(matop.product, [[25,11],[58,32],[91,53]]))
 
         # Verify that the properties of the matrix product are valid
         self.assertEqual(matop.productShape, (3,2))
@@ -126,14 +135,14 @@ class TestMatOp(unittest.TestCase):
         self.assertEqual(matop.getProductColSum(1), 96)
         self.assertEqual(matop.getProductColProd(0), 131950)
         self.assertEqual(matop.getProductColProd(1), 18656)
-        self.assertTrue(np.array_equal(matop.getProductColCumSum(),
-                                       np.array([[25,11],
-                                                 [83,43],
-                                                 [174,96]])))
-        self.assertTrue(np.array_equal(matop.getProductColCumProd(),
-                                       np.array([[25,11],
-                                                 [1450,352],
-                                                 [131950,18656]])))
+        self.assertTrue(arr_eq(matop.getProductColCumSum(),
+                               [[25,11],
+                                [83,43],
+                                [174,96]]))
+        self.assertTrue(arr_eq(matop.getProductColCumProd(),
+                               [[25,11],
+                                [1450,352],
+                                [131950,18656]]))
 
         # Verify the statistics calculated on/along a row produces correct
         # values
@@ -143,14 +152,14 @@ class TestMatOp(unittest.TestCase):
         self.assertEqual(matop.getProductRowProd(0), 275)
         self.assertEqual(matop.getProductRowProd(1), 1856)
         self.assertEqual(matop.getProductRowProd(2), 4823)
-        self.assertTrue(np.array_equal(matop.getProductRowCumSum(),
-                                       np.array([[25,36],
-                                                 [58,90],
-                                                 [91,144]])))
-        self.assertTrue(np.array_equal(matop.getProductRowCumProd(),
-                                       np.array([[25,275],
-                                                 [58,1856],
-                                                 [91,4823]])))
+        self.assertTrue(arr_eq(matop.getProductRowCumSum(),
+                               [[25,36],
+                                [58,90],
+                                [91,144]]))
+        self.assertTrue(arr_eq(matop.getProductRowCumProd(),
+                               [[25,275],
+                                [58,1856],
+                                [91,4823]]))
 
         # Verify the statistics calculated on the entire product matrix are
         # correct.
@@ -161,6 +170,37 @@ class TestMatOp(unittest.TestCase):
         self.assertEqual(matop.getProductTotalMin(), 11)
         self.assertEqual(matop.getProductTotalMax(), 91)
 
+    def test_batch_construction(self):
+        """
+        Create several MatrixOperation objects through the batched fromBatch
+        constructor and verify they match an individually constructed object.
+        Also verify that invalid input to the batch fails the same way the
+        normal constructor does.
+        """
+
+        # Create two MatrixOperation objects in one batch
+        matops = MatrixOperation.fromBatch(['Batch 1', 'Batch 2'],
+                                           [self.matrix_1, self.matrix_1],
+                                           [self.matrix_2, self.matrix_2])
+
+        # Verify each object is valid and matches the individually
+        # constructed equivalent
+        self.assertEqual(len(matops), 2)
+        self.assertEqual(matops[0].name, 'Batch 1')
+        self.assertEqual(matops[1].name, 'Batch 2')
+        for matop in matops:
+            self.assertTrue(matop.valid)
+            self.assertTrue(arr_eq(matop.product, [[25,11],[58,32],[91,53]]))
+            self.assertEqual(matop.getProductColSum(0), 174)
+            self.assertEqual(matop.getProductTotalSum(), 270)
+
+        # Verify a batch containing a pair that cannot be multiplied throws
+        # an error
+        with self.assertRaises(MatrixOperationError):
+            MatrixOperation.fromBatch(['Bad Batch'],
+                                      [self.matrix_1],
+                                      [self.matrix_3])
+
     def test_off_nominal_operations(self):
         """
         Create a nominal MatrixOperation object and verify that when invalid
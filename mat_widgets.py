@@ -47,11 +47,13 @@ class ImageButton(QAbstractButton):
         # Call super constructor
         super().__init__(parent)
         
-        # Define instance variables
+        # Define instance variables. Every provided image is decoded into a
+        # QPixmap once here, so cycling through them later never goes back to
+        # disk.
         self.enabled = True
-        self.__images = list(args)
+        self.__pixmaps = [QPixmap(image) for image in args]
         self.__state = 0
-        self.__pixmap = QPixmap(self.__images[self.__state])
+        self.__pixmap = self.__pixmaps[self.__state]
         if size:
             # Use provided size if one was provided
             self.__size = size
@@ -59,12 +61,24 @@ class ImageButton(QAbstractButton):
             # Use size of image if no size was provided
             self.__size = QSize(self.__pixmap.width(), self.__pixmap.height())
 
+        # Pre-scale the pixmap to the button size once. Painting an already
+        # scaled pixmap is a plain blit, where handing paintEvent the full
+        # size image would make Qt rescale it on every repaint.
+        self.__scaledPixmap = self.__pixmap.scaled(
+            self.__size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
     def nextImage(self):
         """Update the image if more than one was provided"""
-        if len(self.__images) > 1:
-            self.__state = (self.__state + 1) % len(self.__images)
-            self.__pixmap = QPixmap(self.__images[self.__state])
-        
+        if len(self.__pixmaps) > 1:
+            self.__state = (self.__state + 1) % len(self.__pixmaps)
+            self.__pixmap = self.__pixmaps[self.__state]
+
+            # Rescale to the button's current size, falling back to the
+            # requested size if the widget hasn't been laid out yet.
+            target = self.size() if self.size().isValid() and not self.size().isEmpty() else self.__size
+            self.__scaledPixmap = self.__pixmap.scaled(
+                target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
     def mouseReleaseEvent(self, event):
         # Do not respond if button is disabled
         if not self.enabled: return
@@ -75,9 +89,15 @@ class ImageButton(QAbstractButton):
         # Call the super method
         super().mouseReleaseEvent(event)
 
+    def resizeEvent(self, event):
+        """Rescale the cached pixmap when the widget's size actually changes"""
+        super().resizeEvent(event)
+        self.__scaledPixmap = self.__pixmap.scaled(
+            event.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.drawPixmap(event.rect(), self.__pixmap)
+        painter.drawPixmap(0, 0, self.__scaledPixmap)
 
     def sizeHint(self):
         return self.__size